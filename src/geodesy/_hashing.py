@@ -0,0 +1,15 @@
+"""Private helpers for hash caching."""
+
+
+class CachedHash:
+    """Base class reserving a ``_hash`` slot for a precomputed hash.
+
+    The slot lives outside the dataclass fields, so the cached hash does not
+    show up in ``dataclasses.fields()`` or ``dataclasses.asdict()``. Subclasses
+    must set it during initialization and rebuild through their constructor on
+    unpickling (see ``__reduce__``), as string hashes differ between processes.
+    """
+
+    __slots__ = ("_hash",)
+
+    _hash: int
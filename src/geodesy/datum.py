@@ -4,8 +4,14 @@ A datum defines the position and orientation of a reference ellipsoid
 relative to the Earth.
 """
 
-from dataclasses import dataclass
+import math
+import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
+from geodesy._hashing import CachedHash
 from geodesy.ellipsoid import (
     AIRY_1830,
     CLARKE_1866,
@@ -16,10 +22,14 @@ from geodesy.ellipsoid import (
 )
 
 
-@dataclass(frozen=True, slots=True)
-class HelmertParameters:
+@dataclass(frozen=True, slots=True, eq=False)
+class HelmertParameters(CachedHash):
     """7-parameter Helmert transformation (Bursa-Wolf) to WGS84.
 
+    The rotations (in radians), scale factor and rotation matrix are computed
+    once at initialization. The rotation matrix uses the small-angle
+    (linearized) Bursa-Wolf form.
+
     Attributes:
         tx: Translation along X-axis in metres.
         ty: Translation along Y-axis in metres.
@@ -28,6 +38,12 @@ class HelmertParameters:
         ry: Rotation around Y-axis in arc-seconds.
         rz: Rotation around Z-axis in arc-seconds.
         s: Scale factor in parts per million (ppm).
+        rx_rad: Rotation around X-axis in radians (derived).
+        ry_rad: Rotation around Y-axis in radians (derived).
+        rz_rad: Rotation around Z-axis in radians (derived).
+        scale_factor: Scale factor, i.e. ``1 + s * 1e-6`` (derived).
+        matrix: Scaled rotation matrix, row-major (derived).
+        translation: Translation vector in metres (derived).
 
     Example:
         >>> OSGB36.to_wgs84.tx
@@ -42,9 +58,131 @@ class HelmertParameters:
     rz: float
     s: float
 
+    rx_rad: float = field(init=False, repr=False, compare=False)
+    ry_rad: float = field(init=False, repr=False, compare=False)
+    rz_rad: float = field(init=False, repr=False, compare=False)
+    scale_factor: float = field(init=False, repr=False, compare=False)
+    matrix: tuple[
+        tuple[float, float, float],
+        tuple[float, float, float],
+        tuple[float, float, float],
+    ] = field(init=False, repr=False, compare=False)
+    translation: tuple[float, float, float] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        k = math.pi / 648000  # arc-seconds to radians
+        rx, ry, rz = self.rx * k, self.ry * k, self.rz * k
+        m = 1 + self.s * 1e-6
+        object.__setattr__(self, "rx_rad", rx)
+        object.__setattr__(self, "ry_rad", ry)
+        object.__setattr__(self, "rz_rad", rz)
+        object.__setattr__(self, "scale_factor", m)
+        object.__setattr__(
+            self,
+            "matrix",
+            (
+                (m, -rz * m, ry * m),
+                (rz * m, m, -rx * m),
+                (-ry * m, rx * m, m),
+            ),
+        )
+        object.__setattr__(self, "translation", (self.tx, self.ty, self.tz))
+        object.__setattr__(self, "_hash", hash(self.as_tuple()))
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, HelmertParameters):
+            return NotImplemented
+        return (
+            self.tx == other.tx
+            and self.ty == other.ty
+            and self.tz == other.tz
+            and self.rx == other.rx
+            and self.ry == other.ry
+            and self.rz == other.rz
+            and self.s == other.s
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[type["HelmertParameters"], tuple[object, ...]]:
+        return (type(self), self.as_tuple())
+
+    def as_tuple(self) -> tuple[float, float, float, float, float, float, float]:
+        """Return the seven parameters as ``(tx, ty, tz, rx, ry, rz, s)``."""
+        return (self.tx, self.ty, self.tz, self.rx, self.ry, self.rz, self.s)
+
+    def apply(self, x: float, y: float, z: float) -> tuple[float, float, float]:
+        """Apply the transformation to geocentric Cartesian coordinates.
+
+        Args:
+            x: X coordinate in metres.
+            y: Y coordinate in metres.
+            z: Z coordinate in metres.
 
-@dataclass(frozen=True, slots=True)
-class Datum:
+        Returns:
+            The transformed ``(x, y, z)`` coordinates in metres.
+        """
+        if self is IDENTITY_HELMERT:
+            return x, y, z
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = self.matrix
+        tx, ty, tz = self.translation
+        return (
+            tx + m00 * x + m01 * y + m02 * z,
+            ty + m10 * x + m11 * y + m12 * z,
+            tz + m20 * x + m21 * y + m22 * z,
+        )
+
+    def apply_batch(
+        self, xs: Iterable[float], ys: Iterable[float], zs: Iterable[float]
+    ) -> tuple[list[float], list[float], list[float]]:
+        """Apply the transformation to a batch of geocentric Cartesian coordinates.
+
+        The coordinates are passed as separate sequences of X, Y and Z values
+        (rather than as a sequence of points), and the rotation matrix and
+        translation are unpacked only once for the whole batch.
+
+        Args:
+            xs: X coordinates in metres.
+            ys: Y coordinates in metres.
+            zs: Z coordinates in metres.
+
+        Returns:
+            The transformed X, Y and Z coordinates in metres.
+
+        Raises:
+            ValueError: If ``xs``, ``ys`` and ``zs`` are not of equal length.
+        """
+        xs, ys, zs = list(xs), list(ys), list(zs)
+        if not len(xs) == len(ys) == len(zs):
+            msg = "xs, ys and zs must be of equal length"
+            raise ValueError(msg)
+        if self is IDENTITY_HELMERT:
+            return xs, ys, zs
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = self.matrix
+        tx, ty, tz = self.translation
+        out_xs: list[float] = []
+        out_ys: list[float] = []
+        out_zs: list[float] = []
+        for x, y, z in zip(xs, ys, zs, strict=True):
+            out_xs.append(tx + m00 * x + m01 * y + m02 * z)
+            out_ys.append(ty + m10 * x + m11 * y + m12 * z)
+            out_zs.append(tz + m20 * x + m21 * y + m22 * z)
+        return out_xs, out_ys, out_zs
+
+
+#: Identity Helmert transformation, shared by datums coincident with WGS84.
+IDENTITY_HELMERT = HelmertParameters(
+    tx=0.0, ty=0.0, tz=0.0, rx=0.0, ry=0.0, rz=0.0, s=0.0
+)
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Datum(CachedHash):
     """A geodetic datum for coordinate reference systems.
 
     Attributes:
@@ -53,6 +191,7 @@ class Datum:
         ellipsoid: Reference ellipsoid.
         to_wgs84: Helmert transformation parameters to WGS84, if applicable.
         remarks: Remarks, if any.
+        urn: Uniform Resource Name (URN) (derived).
 
     Example:
         >>> WGS84.ellipsoid.a
@@ -67,13 +206,97 @@ class Datum:
     to_wgs84: HelmertParameters | None = None
     remarks: str | None = None
 
-    @property
-    def urn(self) -> str:
-        """Uniform Resource Name (URN)."""
-        return f"urn:ogc:def:datum:EPSG::{self.code}"
+    urn: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", sys.intern(self.name))
+        if self.remarks is not None:
+            object.__setattr__(self, "remarks", sys.intern(self.remarks))
+        object.__setattr__(
+            self, "urn", sys.intern(f"urn:ogc:def:datum:EPSG::{self.code}")
+        )
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((self.name, self.code, self.ellipsoid, self.to_wgs84, self.remarks)),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Datum):
+            return NotImplemented
+        return (
+            self.code == other.code
+            and self.name == other.name
+            and self.ellipsoid == other.ellipsoid
+            and self.to_wgs84 == other.to_wgs84
+            and self.remarks == other.remarks
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[type["Datum"], tuple[object, ...]]:
+        return (
+            type(self),
+            (self.name, self.code, self.ellipsoid, self.to_wgs84, self.remarks),
+        )
+
+    @classmethod
+    def get(
+        cls,
+        name: str,
+        code: int,
+        ellipsoid: Ellipsoid,
+        to_wgs84: HelmertParameters | None = None,
+        remarks: str | None = None,
+    ) -> "Datum":
+        """Get a (cached) datum with the given parameters.
+
+        Repeated calls with identical arguments (of identical types) return the
+        same instance. The ellipsoid and Helmert parameters are matched by
+        identity, so the returned datum always holds the objects passed in.
+
+        Args:
+            name: Human-readable name.
+            code: EPSG code.
+            ellipsoid: Reference ellipsoid.
+            to_wgs84: Helmert transformation parameters to WGS84, if applicable.
+            remarks: Remarks, if any.
+
+        Returns:
+            The datum.
+        """
+        return cls._get(
+            name, code, ellipsoid, id(ellipsoid), to_wgs84, id(to_wgs84), remarks
+        )
+
+    @classmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _get(  # noqa: PLR0913, PLR0917
+        cls,
+        name: str,
+        code: int,
+        ellipsoid: Ellipsoid,
+        ellipsoid_id: int,  # noqa: ARG003
+        to_wgs84: HelmertParameters | None,
+        to_wgs84_id: int,  # noqa: ARG003
+        remarks: str | None,
+    ) -> "Datum":
+        # The cache also holds references to ellipsoid and to_wgs84, so their
+        # ids cannot be reused while the entry is alive.
+        return cls(
+            name=name,
+            code=code,
+            ellipsoid=ellipsoid,
+            to_wgs84=to_wgs84,
+            remarks=remarks,
+        )
 
 
 # Built-in datums
+#: European Datum 1950 (`EPSG:6230 <https://epsg.io/6230-datum>`_). Uses International 1924 ellipsoid.
 ED50 = Datum(
     name="European Datum 1950",
     code=6230,
@@ -88,17 +311,17 @@ ED50 = Datum(
         s=0.0,
     ),
 )
-""": :European Datum 1950 (`EPSG:6230 <https://epsg.io/6230-datum>`_). Uses International 1924 ellipsoid."""
 
+#: European Terrestrial Reference System 1989 (`EPSG:6258 <https://epsg.io/6258-datum>`_), coincident with WGS84 at epoch 1989.0. Uses GRS 1980 ellipsoid.
 ETRS89 = Datum(
     name="European Terrestrial Reference System 1989 ensemble",
     code=6258,
     ellipsoid=GRS_1980,
-    to_wgs84=HelmertParameters(tx=0.0, ty=0.0, tz=0.0, rx=0.0, ry=0.0, rz=0.0, s=0.0),
+    to_wgs84=IDENTITY_HELMERT,
     remarks="Has been realized through ETRF89, ETRF90, ETRF91, ETRF92, ETRF93, ETRF94, ETRF96, ETRF97, ETRF2000, ETRF2005, ETRF2014 and ETRF2020. This 'ensemble' covers any or all of these realizations without distinction.",
 )
-""": :European Terrestrial Reference System 1989 (`EPSG:6258 <https://epsg.io/6258-datum>`_), coincident with WGS84 at epoch 1989.0. Uses GRS 1980 ellipsoid."""
 
+#: North American Datum 1927 (`EPSG:6267 <https://epsg.io/6267-datum>`_). Uses Clarke 1866 ellipsoid.
 NAD27 = Datum(
     name="North American Datum 1927",
     code=6267,
@@ -114,17 +337,17 @@ NAD27 = Datum(
     ),
     remarks="In United States (USA) and Canada, replaced by North American Datum 1983 (NAD83) (code 6269) ; in Mexico, replaced by Mexican Datum of 1993 (code 1042).",
 )
-""": :North American Datum 1927 (`EPSG:6267 <https://epsg.io/6267-datum>`_). Uses Clarke 1866 ellipsoid."""
 
+#: North American Datum 1983 (`EPSG:6269 <https://epsg.io/6269-datum>`_), coincident with WGS84 within original realization accuracy. Uses GRS 1980 ellipsoid.
 NAD83 = Datum(
     name="North American Datum 1983",
     code=6269,
     ellipsoid=GRS_1980,
-    to_wgs84=HelmertParameters(tx=0.0, ty=0.0, tz=0.0, rx=0.0, ry=0.0, rz=0.0, s=0.0),
+    to_wgs84=IDENTITY_HELMERT,
     remarks="Although the 1986 adjustment included connections to Greenland and Mexico, it has not been adopted there. In Canada and US, replaced NAD27.",
 )
-""": :North American Datum 1983 (`EPSG:6269 <https://epsg.io/6269-datum>`_), coincident with WGS84 within original realization accuracy. Uses GRS 1980 ellipsoid."""
 
+#: Ordnance Survey of Great Britain 1936 (`EPSG:6277 <https://epsg.io/6277-datum>`_). Uses Airy 1830 ellipsoid.
 OSGB36 = Datum(
     name="Ordnance Survey of Great Britain 1936",
     code=6277,
@@ -140,13 +363,23 @@ OSGB36 = Datum(
     ),
     remarks="The average accuracy of OSTN compared to the old triangulation network (down to 3rd order) is 0.1m. With the introduction of OSTN15, the area for OGSB36 has effectively been extended from Britain to cover the adjacent UK Continental Shelf.",
 )
-""": :Ordnance Survey of Great Britain 1936 (`EPSG:6277 <https://epsg.io/6277-datum>`_). Uses Airy 1830 ellipsoid."""
 
+#: World Geodetic System 1984 (`EPSG:6326 <https://epsg.io/6326-datum>`_), the global reference datum for GPS. Uses WGS 84 datum.
 WGS84 = Datum(
     name="World Geodetic System 1984 ensemble",
     code=6326,
     ellipsoid=WGS_84,
-    to_wgs84=HelmertParameters(tx=0.0, ty=0.0, tz=0.0, rx=0.0, ry=0.0, rz=0.0, s=0.0),
+    to_wgs84=IDENTITY_HELMERT,
     remarks="EPSG::6326 has been the then current realization. No distinction is made between the original and subsequent (G730, G873, G1150, G1674, G1762, G2139 and G2296) WGS 84 frames. Since 1997, WGS 84 has been maintained within 10cm of the then current ITRF.",
 )
-""": :World Geodetic System 1984 (`EPSG:6326 <https://epsg.io/6326-datum>`_), the global reference datum for GPS. Uses WGS 84 datum."""
+
+#: All built-in datums.
+BUILTIN_DATUMS: tuple[Datum, ...] = (WGS84, ETRS89, NAD83, NAD27, ED50, OSGB36)
+
+#: Read-only mapping of EPSG code to built-in datum.
+BUILTIN_DATUMS_BY_CODE: Mapping[int, Datum] = MappingProxyType(
+    {datum.code: datum for datum in BUILTIN_DATUMS}
+)
+assert len(BUILTIN_DATUMS_BY_CODE) == len(BUILTIN_DATUMS), (
+    "duplicate EPSG codes in built-in datums"
+)
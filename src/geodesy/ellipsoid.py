@@ -4,20 +4,36 @@ An ellipsoid is defined by its semi-major axis (a) and flattening (f).
 All other parameters are derived from these.
 """
 
-from dataclasses import dataclass
-from functools import cached_property
+import math
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
+from geodesy._hashing import CachedHash
 
-@dataclass(frozen=True)
-class Ellipsoid:
+
+@dataclass(frozen=True, slots=True, init=False, eq=False)
+class Ellipsoid(CachedHash):
     """A reference ellipsoid for geodetic calculations.
 
+    The derived parameters are computed once at initialization and stored
+    alongside the defining ones.
+
     Attributes:
         name: Human-readable name
         code: EPSG code
         a: Semi-major axis in metres
         f: Flattening (dimensionless)
         remarks: Remarks, if any
+        rf: Inverse flattening, or infinity for a sphere (derived)
+        b: Semi-minor axis in metres (derived)
+        e2: First eccentricity squared (derived)
+        e: First eccentricity (derived)
+        ep2: Second eccentricity squared, i.e. ``(a² - b²) / b²`` (derived)
+        one_minus_f: ``1 - f``, i.e. the axis ratio ``b / a`` (derived)
+        urn: Uniform Resource Name (URN) (derived)
 
     Example:
         >>> WGS_84.a
@@ -32,33 +48,114 @@ class Ellipsoid:
     f: float  # flattening
     remarks: str | None = None
 
-    @cached_property
-    def b(self) -> float:
-        """Semi-minor axis in metres."""
-        return self.a * (1 - self.f)
-
-    @cached_property
-    def e2(self) -> float:
-        """First eccentricity squared."""
-        return 2 * self.f - self.f**2
-
-    @cached_property
-    def e(self) -> float:
-        """First eccentricity."""
-        return self.e2**0.5
-
-    @cached_property
-    def ep2(self) -> float:
-        """Second eccentricity squared."""
-        return self.e2 / (1 - self.e2)
-
-    @cached_property
-    def urn(self) -> str:
-        """Uniform Resource Name (URN)."""
-        return f"urn:ogc:def:ellipsoid:EPSG::{self.code}"
+    rf: float = field(init=False, repr=False, compare=False)
+    b: float = field(init=False, repr=False, compare=False)
+    e2: float = field(init=False, repr=False, compare=False)
+    e: float = field(init=False, repr=False, compare=False)
+    ep2: float = field(init=False, repr=False, compare=False)
+    one_minus_f: float = field(init=False, repr=False, compare=False)
+    urn: str = field(init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        name: str,
+        code: int,
+        a: float,
+        f: float,
+        remarks: str | None = None,
+    ) -> None:
+        set_field = object.__setattr__
+        set_field(self, "name", sys.intern(name))
+        set_field(self, "code", code)
+        set_field(self, "a", a)
+        set_field(self, "f", f)
+        if remarks is not None:
+            remarks = sys.intern(remarks)
+        set_field(self, "remarks", remarks)
+
+        one_minus_f = 1 - f
+        e2 = 2 * f - f * f
+        set_field(self, "rf", 1 / f if f else math.inf)
+        set_field(self, "b", a * one_minus_f)
+        set_field(self, "e2", e2)
+        set_field(self, "e", math.sqrt(e2))
+        set_field(self, "ep2", e2 / (1 - e2))
+        set_field(self, "one_minus_f", one_minus_f)
+        set_field(self, "urn", sys.intern(f"urn:ogc:def:ellipsoid:EPSG::{code}"))
+        set_field(self, "_hash", hash((self.name, code, a, f, remarks)))
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Ellipsoid):
+            return NotImplemented
+        return (
+            self.code == other.code
+            and self.a == other.a
+            and self.f == other.f
+            and self.name == other.name
+            and self.remarks == other.remarks
+        )
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self) -> tuple[type["Ellipsoid"], tuple[object, ...]]:
+        return (type(self), (self.name, self.code, self.a, self.f, self.remarks))
+
+    @classmethod
+    def get(
+        cls,
+        name: str,
+        code: int,
+        a: float,
+        f: float,
+        remarks: str | None = None,
+    ) -> "Ellipsoid":
+        """Get a (cached) ellipsoid with the given parameters.
+
+        Repeated calls with identical arguments (of identical types) return the
+        same instance, so the derived parameters are only computed once.
+
+        Args:
+            name: Human-readable name.
+            code: EPSG code.
+            a: Semi-major axis in metres.
+            f: Flattening (dimensionless).
+            remarks: Remarks, if any.
+
+        Returns:
+            The ellipsoid.
+        """
+        return cls._get(name, code, a, f, remarks)
+
+    @classmethod
+    @lru_cache(maxsize=256, typed=True)
+    def _get(
+        cls, name: str, code: int, a: float, f: float, remarks: str | None
+    ) -> "Ellipsoid":
+        return cls(name=name, code=code, a=a, f=f, remarks=remarks)
+
+    def unpack(self) -> tuple[float, float, float, float]:
+        """Return the parameters commonly used in geodetic formulas.
+
+        Unpacking into local variables once, before a loop over many points,
+        avoids repeated attribute lookups inside the loop.
+
+        Returns:
+            The semi-major axis, semi-minor axis, first eccentricity squared
+            and second eccentricity squared as ``(a, b, e2, ep2)``.
+
+        Example:
+            >>> a, b, e2, ep2 = WGS_84.unpack()
+            >>> a
+            6378137.0
+        """
+        return self.a, self.b, self.e2, self.ep2
 
 
 # Built-in ellipsoids
+#: Airy 1830 ellipsoid (`EPSG:7001 <https://epsg.io/7001-ellipsoid>`_). Used by OSGB36 datum.
 AIRY_1830 = Ellipsoid(
     name="Airy 1830",
     code=7001,
@@ -66,8 +163,8 @@ AIRY_1830 = Ellipsoid(
     f=1 / 299.3249646,
     remarks="Original definition is a=20923713, b=20853810 feet of 1796. 1/f is given to 7 decimal places. For the 1936 retriangulation OSGB defines the relationship of 10 feet of 1796 to the International metre through ([10^0.48401603]/10) exactly = 0.3048007491...",
 )
-""": :Airy 1830 ellipsoid (`EPSG:7001 <https://epsg.io/7001-ellipsoid>`_). Used by OSGB36 datum."""
 
+#: Clarke 1866 ellipsoid (`EPSG:7008 <https://epsg.io/7008-ellipsoid>`_). Used by NAD27 datum.
 CLARKE_1866 = Ellipsoid(
     name="Clarke 1866",
     code=7008,
@@ -75,8 +172,8 @@ CLARKE_1866 = Ellipsoid(
     f=1 / 294.978698213898,
     remarks="Original definition a=20926062 and b=20855121 (British) feet. Uses Clarke's 1865 inch-metre ratio of 39.370432 to obtain metres. (Metric value then converted to US survey feet for use in the US and international feet for use in Cayman Islands).",
 )
-""": :Clarke 1866 ellipsoid (`EPSG:7008 <https://epsg.io/7008-ellipsoid>`_). Used by NAD27 datum."""
 
+#: GRS 1980 ellipsoid (`EPSG:7019 <https://epsg.io/7019-ellipsoid>`_). Used by NAD83 and ETRS89 datums.
 GRS_1980 = Ellipsoid(
     name="GRS 1980",
     code=7019,
@@ -84,8 +181,8 @@ GRS_1980 = Ellipsoid(
     f=1 / 298.257222101,
     remarks="Adopted by IUGG 1979 Canberra. Inverse flattening is derived from geocentric gravitational constant GM = 3986005e8 m*m*m/s/s; dynamic form factor J2 = 108263e-8 and Earth's angular velocity = 7292115e-11 rad/s.",
 )
-""": :GRS 1980 ellipsoid (`EPSG:7019 <https://epsg.io/7019-ellipsoid>`_). Used by NAD83 and ETRS89 datums."""
 
+#: International 1924 ellipsoid (`EPSG:7022 <https://epsg.io/7022-ellipsoid>`_), also known as Hayford 1909. Used by ED50 datum.
 INTERNATIONAL_1924 = Ellipsoid(
     name="International 1924",
     code=7022,
@@ -93,8 +190,8 @@ INTERNATIONAL_1924 = Ellipsoid(
     f=1 / 297.0,
     remarks="Adopted by IUGG 1924 in Madrid. Based on Hayford 1909/1910 figures.",
 )
-""": :International 1924 ellipsoid (`EPSG:7022 <https://epsg.io/7022-ellipsoid>`_), also known as Hayford 1909. Used by ED50 datum."""
 
+#: WGS 84 ellipsoid (`EPSG:7030 <https://epsg.io/7030-ellipsoid>`_). Used by WGS84 datum.
 WGS_84 = Ellipsoid(
     name="WGS 84",
     code=7030,
@@ -102,4 +199,20 @@ WGS_84 = Ellipsoid(
     f=1 / 298.257223563,
     remarks="1/f derived from four defining parameters semi-major axis; C20 = -484.16685*10e-6; earth's angular velocity ω = 7292115e-11 rad/sec; gravitational constant GM = 3986005e8 m*m*m/s/s. In 1994 new GM = 3986004.418e8 m*m*m/s/s but a and 1/f retained.",
 )
-""": :WGS 84 ellipsoid (`EPSG:7030 <https://epsg.io/7030-ellipsoid>`_). Used by WGS84 datum."""
+
+#: All built-in ellipsoids.
+BUILTIN_ELLIPSOIDS: tuple[Ellipsoid, ...] = (
+    WGS_84,
+    GRS_1980,
+    AIRY_1830,
+    CLARKE_1866,
+    INTERNATIONAL_1924,
+)
+
+#: Read-only mapping of EPSG code to built-in ellipsoid.
+BUILTIN_ELLIPSOIDS_BY_CODE: Mapping[int, Ellipsoid] = MappingProxyType(
+    {ellipsoid.code: ellipsoid for ellipsoid in BUILTIN_ELLIPSOIDS}
+)
+assert len(BUILTIN_ELLIPSOIDS_BY_CODE) == len(BUILTIN_ELLIPSOIDS), (
+    "duplicate EPSG codes in built-in ellipsoids"
+)
@@ -1,12 +1,20 @@
 """Tests for the datum module."""
 
-from dataclasses import FrozenInstanceError
+import math
+import os
+import pickle
+import subprocess
+import sys
+from dataclasses import FrozenInstanceError, asdict
 
 import pytest
 
 from geodesy.datum import (
+    BUILTIN_DATUMS,
+    BUILTIN_DATUMS_BY_CODE,
     ED50,
     ETRS89,
+    IDENTITY_HELMERT,
     NAD27,
     NAD83,
     OSGB36,
@@ -61,6 +69,13 @@ class TestHelmertParameters:
         with pytest.raises(FrozenInstanceError):
             params.tx = 10.0  # type: ignore[misc]
 
+    def test_helmert_parameters_has_no_instance_dict(self) -> None:
+        """Test that Helmert parameters use slots instead of an instance dictionary."""
+        params = HelmertParameters(
+            tx=1.0, ty=2.0, tz=3.0, rx=0.1, ry=0.2, rz=0.3, s=0.5
+        )
+        assert not hasattr(params, "__dict__")
+
     def test_helmert_parameters_equality(self) -> None:
         """Test Helmert parameters equality comparison."""
         p1 = HelmertParameters(tx=1.0, ty=2.0, tz=3.0, rx=0.1, ry=0.2, rz=0.3, s=0.5)
@@ -69,6 +84,21 @@ class TestHelmertParameters:
         assert p1 == p2
         assert p1 != p3
 
+    def test_helmert_parameters_equality_per_parameter(self) -> None:
+        """Test that every parameter takes part in equality comparison."""
+        values = {"tx": 1.0, "ty": 2.0, "tz": 3.0, "rx": 0.1, "ry": 0.2, "rz": 0.3}
+        p1 = HelmertParameters(**values, s=0.5)
+        for name in values:
+            assert p1 != HelmertParameters(**{**values, name: 9.0}, s=0.5)
+        assert p1 != HelmertParameters(**values, s=9.0)
+
+    def test_helmert_parameters_inequality_with_other_types(self) -> None:
+        """Test that Helmert parameters do not equal other types."""
+        params = HelmertParameters(
+            tx=1.0, ty=2.0, tz=3.0, rx=0.1, ry=0.2, rz=0.3, s=0.5
+        )
+        assert params != (1.0, 2.0, 3.0, 0.1, 0.2, 0.3, 0.5)
+
     def test_helmert_parameters_hash(self) -> None:
         """Test that Helmert parameters are hashable."""
         p1 = HelmertParameters(tx=1.0, ty=2.0, tz=3.0, rx=0.1, ry=0.2, rz=0.3, s=0.5)
@@ -91,6 +121,135 @@ class TestHelmertParameters:
         assert params.rz == -0.3
         assert params.s == -20.0
 
+    def test_helmert_parameters_as_tuple(self) -> None:
+        """Test flattening Helmert parameters into a tuple."""
+        params = HelmertParameters(
+            tx=1.0, ty=2.0, tz=3.0, rx=0.1, ry=0.2, rz=0.3, s=0.5
+        )
+        assert params.as_tuple() == (1.0, 2.0, 3.0, 0.1, 0.2, 0.3, 0.5)
+
+    def test_helmert_parameters_rotations_in_radians(self) -> None:
+        """Test the derived rotations in radians."""
+        params = HelmertParameters(
+            tx=0.0, ty=0.0, tz=0.0, rx=1.0, ry=-2.0, rz=3600.0, s=0.0
+        )
+        assert params.rx_rad == pytest.approx(math.radians(1 / 3600))
+        assert params.ry_rad == pytest.approx(math.radians(-2 / 3600))
+        assert params.rz_rad == pytest.approx(math.radians(1.0))
+
+    def test_helmert_parameters_scale_factor(self) -> None:
+        """Test the derived unitless scale factor."""
+        params = HelmertParameters(
+            tx=0.0, ty=0.0, tz=0.0, rx=0.0, ry=0.0, rz=0.0, s=-20.4894
+        )
+        assert params.scale_factor == pytest.approx(1 - 20.4894e-6)
+
+    def test_helmert_parameters_translation(self) -> None:
+        """Test the derived translation vector."""
+        params = HelmertParameters(
+            tx=1.0, ty=2.0, tz=3.0, rx=0.1, ry=0.2, rz=0.3, s=0.5
+        )
+        assert params.translation == (1.0, 2.0, 3.0)
+
+    def test_helmert_parameters_matrix(self) -> None:
+        """Test the derived scaled rotation matrix."""
+        params = HelmertParameters(
+            tx=0.0, ty=0.0, tz=0.0, rx=1.0, ry=2.0, rz=3.0, s=10.0
+        )
+        k = math.pi / (180 * 3600)
+        m = 1 + 10.0 * 1e-6
+        expected = (
+            (m, -3.0 * k * m, 2.0 * k * m),
+            (3.0 * k * m, m, -1.0 * k * m),
+            (-2.0 * k * m, 1.0 * k * m, m),
+        )
+        for row, expected_row in zip(params.matrix, expected, strict=True):
+            assert row == pytest.approx(expected_row)
+
+    def test_helmert_parameters_apply_zero_transform(self) -> None:
+        """Test that the zero transform leaves coordinates unchanged."""
+        params = HelmertParameters(
+            tx=0.0, ty=0.0, tz=0.0, rx=0.0, ry=0.0, rz=0.0, s=0.0
+        )
+        assert params.apply(3980581.0, -111.0, 4966824.0) == (
+            3980581.0,
+            -111.0,
+            4966824.0,
+        )
+
+    def test_identity_helmert_apply(self) -> None:
+        """Test that the identity transform returns coordinates unchanged."""
+        assert IDENTITY_HELMERT.apply(3980581.0, -111.0, 4966824.0) == (
+            3980581.0,
+            -111.0,
+            4966824.0,
+        )
+
+    def test_helmert_parameters_apply_translation(self) -> None:
+        """Test applying a translation-only transform."""
+        params = HelmertParameters(
+            tx=-87.0, ty=-98.0, tz=-121.0, rx=0.0, ry=0.0, rz=0.0, s=0.0
+        )
+        assert params.apply(1000.0, 2000.0, 3000.0) == (913.0, 1902.0, 2879.0)
+
+    def test_helmert_parameters_apply(self) -> None:
+        """Test applying a full 7-parameter transform."""
+        params = HelmertParameters(
+            tx=446.448,
+            ty=-125.157,
+            tz=542.060,
+            rx=0.1502,
+            ry=0.2470,
+            rz=0.8421,
+            s=-20.4894,
+        )
+        x, y, z = 3909833.018, -147097.139, 5020322.478
+        k = math.pi / (180 * 3600)
+        rx, ry, rz = 0.1502 * k, 0.2470 * k, 0.8421 * k
+        m = 1 + -20.4894 * 1e-6
+        expected = (
+            446.448 + m * (x - rz * y + ry * z),
+            -125.157 + m * (rz * x + y - rx * z),
+            542.060 + m * (-ry * x + rx * y + z),
+        )
+        assert params.apply(x, y, z) == pytest.approx(expected, abs=1e-6)
+
+    def test_helmert_parameters_apply_batch(self) -> None:
+        """Test that a batch transform matches transforming each point."""
+        assert OSGB36.to_wgs84 is not None
+        xs = [3909833.018, 3980581.0, 4000000.0]
+        ys = [-147097.139, -111.0, 50000.0]
+        zs = [5020322.478, 4966824.0, 4900000.0]
+        out_xs, out_ys, out_zs = OSGB36.to_wgs84.apply_batch(xs, ys, zs)
+        for point, x, y, z in zip(
+            zip(out_xs, out_ys, out_zs, strict=True), xs, ys, zs, strict=True
+        ):
+            assert point == OSGB36.to_wgs84.apply(x, y, z)
+
+    def test_helmert_parameters_apply_batch_empty(self) -> None:
+        """Test transforming an empty batch."""
+        assert OSGB36.to_wgs84 is not None
+        assert OSGB36.to_wgs84.apply_batch([], [], []) == ([], [], [])
+
+    def test_identity_helmert_apply_batch(self) -> None:
+        """Test that the identity batch transform returns copies of its input."""
+        xs, ys, zs = [1.0, 2.0], [3.0, 4.0], [5.0, 6.0]
+        out_xs, out_ys, out_zs = IDENTITY_HELMERT.apply_batch(xs, ys, zs)
+        assert (out_xs, out_ys, out_zs) == (xs, ys, zs)
+        assert out_xs is not xs
+
+    @pytest.mark.parametrize(
+        "params",
+        [IDENTITY_HELMERT, OSGB36.to_wgs84],
+        ids=["IDENTITY_HELMERT", "OSGB36"],
+    )
+    def test_helmert_parameters_apply_batch_unequal_lengths(
+        self, params: HelmertParameters
+    ) -> None:
+        """Test that a batch with unequal lengths is rejected."""
+        with pytest.raises(ValueError, match="xs, ys and zs must be of equal length"):
+            params.apply_batch([1.0, 2.0], [3.0], [5.0, 6.0])
+
 
 class TestDatum:
     """Tests for the Datum class."""
@@ -153,6 +312,11 @@ class TestDatum:
         with pytest.raises(FrozenInstanceError):
             datum.name = "Changed"  # type: ignore[misc]
 
+    def test_datum_has_no_instance_dict(self) -> None:
+        """Test that datums use slots instead of an instance dictionary."""
+        datum = Datum(name="Test", code=1234, ellipsoid=WGS_84)
+        assert not hasattr(datum, "__dict__")
+
     def test_datum_equality(self) -> None:
         """Test datum equality comparison."""
         d1 = Datum(name="Test", code=1234, ellipsoid=WGS_84)
@@ -161,6 +325,21 @@ class TestDatum:
         assert d1 == d2
         assert d1 != d3
 
+    def test_datum_equality_per_field(self) -> None:
+        """Test that every field takes part in datum equality comparison."""
+        datum = Datum(name="Test", code=1234, ellipsoid=WGS_84)
+        assert datum != Datum(name="Other", code=1234, ellipsoid=WGS_84)
+        assert datum != Datum(name="Test", code=5678, ellipsoid=WGS_84)
+        assert datum != Datum(name="Test", code=1234, ellipsoid=GRS_1980)
+        assert datum != Datum(
+            name="Test", code=1234, ellipsoid=WGS_84, to_wgs84=IDENTITY_HELMERT
+        )
+        assert datum != Datum(name="Test", code=1234, ellipsoid=WGS_84, remarks="")
+
+    def test_datum_inequality_with_other_types(self) -> None:
+        """Test that datums do not equal other types."""
+        assert WGS84 != "urn:ogc:def:datum:EPSG::6326"
+
     def test_datum_hash(self) -> None:
         """Test that datums are hashable."""
         d1 = Datum(name="Test", code=1234, ellipsoid=WGS_84)
@@ -170,6 +349,96 @@ class TestDatum:
         datums = {d1, d2}
         assert len(datums) == 1
 
+    def test_datum_hash_with_equal_ellipsoids(self) -> None:
+        """Test that datums with equal but distinct ellipsoids hash equally."""
+        e1 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        e2 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        d1 = Datum(name="Test", code=1234, ellipsoid=e1)
+        d2 = Datum(name="Test", code=1234, ellipsoid=e2)
+        assert d1 == d2
+        assert hash(d1) == hash(d2)
+
+    def test_datum_hash_is_stable(self) -> None:
+        """Test that the datum hash is consistent across calls."""
+        assert hash(WGS84) == hash(WGS84)
+        assert hash(WGS84) != hash(OSGB36)
+
+    def test_get_returns_cached_instance(self) -> None:
+        """Test that get() returns the same instance for identical arguments."""
+        d1 = Datum.get(name="Test", code=1234, ellipsoid=WGS_84)
+        d2 = Datum.get(name="Test", code=1234, ellipsoid=WGS_84)
+        assert d1 is d2
+        assert d1 == Datum(name="Test", code=1234, ellipsoid=WGS_84)
+
+    def test_get_with_different_arguments(self) -> None:
+        """Test that get() returns distinct instances for different arguments."""
+        d1 = Datum.get(name="Test", code=1234, ellipsoid=WGS_84)
+        d2 = Datum.get(name="Test", code=1234, ellipsoid=GRS_1980)
+        assert d1 is not d2
+        assert d2.ellipsoid is GRS_1980
+
+    def test_get_keeps_identity_of_equal_ellipsoids(self) -> None:
+        """Test that get() does not hand back a datum with another equal ellipsoid."""
+        e1 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        e2 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        d1 = Datum.get(name="Identity", code=1234, ellipsoid=e1)
+        d2 = Datum.get(name="Identity", code=1234, ellipsoid=e2)
+        assert d1.ellipsoid is e1
+        assert d2.ellipsoid is e2
+        assert Datum.get(name="Identity", code=1234, ellipsoid=e2) is d2
+
+    def test_get_keeps_identity_of_equal_helmert_parameters(self) -> None:
+        """Test that get() does not hand back a datum with other equal parameters."""
+        p1 = HelmertParameters(tx=1.0, ty=2.0, tz=3.0, rx=0.0, ry=0.0, rz=0.0, s=0.0)
+        p2 = HelmertParameters(tx=1.0, ty=2.0, tz=3.0, rx=0.0, ry=0.0, rz=0.0, s=0.0)
+        d1 = Datum.get(name="Identity", code=1234, ellipsoid=WGS_84, to_wgs84=p1)
+        d2 = Datum.get(name="Identity", code=1234, ellipsoid=WGS_84, to_wgs84=p2)
+        assert d1.to_wgs84 is p1
+        assert d2.to_wgs84 is p2
+
+    def test_get_positional_and_keyword_arguments(self) -> None:
+        """Test that get() returns the same instance for positional and keyword calls."""
+        d1 = Datum.get("Mixed", 1234, WGS_84)
+        d2 = Datum.get(name="Mixed", code=1234, ellipsoid=WGS_84)
+        assert d1 is d2
+
+    def test_datum_pickle_round_trip(self) -> None:
+        """Test that pickled datums are equal and hash equally."""
+        for datum in BUILTIN_DATUMS:
+            loaded = pickle.loads(pickle.dumps(datum))  # noqa: S301
+            assert loaded == datum
+            assert hash(loaded) == hash(datum)
+            assert loaded.to_wgs84 == datum.to_wgs84
+            assert hash(loaded.to_wgs84) == hash(datum.to_wgs84)
+
+    def test_datum_pickle_across_processes(self) -> None:
+        """Test that datums pickled under another hash seed hash consistently."""
+        seed = "2" if os.environ.get("PYTHONHASHSEED") == "1" else "1"
+        env = {
+            **os.environ,
+            "PYTHONHASHSEED": seed,
+            "PYTHONPATH": os.pathsep.join(sys.path),
+        }
+        code = (
+            "import pickle, sys\n"
+            "from geodesy.datum import OSGB36\n"
+            "sys.stdout.buffer.write(pickle.dumps(OSGB36))\n"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, check=True, env=env
+        )
+        loaded = pickle.loads(result.stdout)  # noqa: S301
+        assert loaded == OSGB36
+        assert hash(loaded) == hash(OSGB36)
+        assert hash(loaded.ellipsoid) == hash(AIRY_1830)
+        assert {OSGB36: 1}.get(loaded) == 1
+        assert len({loaded, OSGB36}) == 1
+
+    def test_datum_asdict_excludes_cached_hash(self) -> None:
+        """Test that the cached hash is not a dataclass field."""
+        assert "_hash" not in asdict(WGS84)
+        assert "_hash" not in asdict(WGS84)["to_wgs84"]
+
 
 class TestDatumURN:
     """Tests for datum URN property."""
@@ -188,6 +457,13 @@ class TestDatumURN:
         """Test WGS84 datum URN."""
         assert WGS84.urn == "urn:ogc:def:datum:EPSG::6326"
 
+    def test_datum_urn_is_interned(self) -> None:
+        """Test that datum URNs are interned."""
+        d1 = Datum(name="Test", code=1234, ellipsoid=WGS_84)
+        d2 = Datum(name="Other", code=1234, ellipsoid=GRS_1980)
+        assert d1.urn is d2.urn
+        assert d1.urn is sys.intern("urn:ogc:def:datum:EPSG::1234")
+
 
 class TestBuiltinDatums:
     """Tests for built-in datum definitions."""
@@ -219,6 +495,12 @@ class TestBuiltinDatums:
         assert ETRS89.to_wgs84 is not None
         assert ETRS89.remarks is not None
 
+    def test_identity_datums_share_identity_helmert(self) -> None:
+        """Test that datums coincident with WGS84 share the identity transform."""
+        assert WGS84.to_wgs84 is IDENTITY_HELMERT
+        assert ETRS89.to_wgs84 is IDENTITY_HELMERT
+        assert NAD83.to_wgs84 is IDENTITY_HELMERT
+
     def test_etrs89_identity_transform(self) -> None:
         """Test ETRS89 has identity Helmert transform (coincident with WGS84)."""
         assert ETRS89.to_wgs84 is not None
@@ -303,23 +585,36 @@ class TestBuiltinDatumsConsistency:
 
     def test_all_datums_have_unique_codes(self) -> None:
         """Test that all built-in datums have unique EPSG codes."""
-        datums = [WGS84, ETRS89, NAD83, NAD27, ED50, OSGB36]
-        codes = [d.code for d in datums]
+        codes = [d.code for d in BUILTIN_DATUMS]
         assert len(codes) == len(set(codes))
 
     def test_all_datums_have_helmert_transform(self) -> None:
         """Test that all built-in datums have Helmert transformation to WGS84."""
-        datums = [WGS84, ETRS89, NAD83, NAD27, ED50, OSGB36]
-        for datum in datums:
+        for datum in BUILTIN_DATUMS:
             assert datum.to_wgs84 is not None
 
     def test_all_datums_have_valid_ellipsoid(self) -> None:
         """Test that all built-in datums reference valid ellipsoids."""
-        datums = [WGS84, ETRS89, NAD83, NAD27, ED50, OSGB36]
-        for datum in datums:
+        for datum in BUILTIN_DATUMS:
             assert isinstance(datum.ellipsoid, Ellipsoid)
             assert datum.ellipsoid.a > 0
 
+    def test_builtin_datums(self) -> None:
+        """Test that all built-in datums are listed."""
+        assert BUILTIN_DATUMS == (WGS84, ETRS89, NAD83, NAD27, ED50, OSGB36)
+
+    def test_builtin_datums_by_code(self) -> None:
+        """Test looking up built-in datums by EPSG code."""
+        assert len(BUILTIN_DATUMS_BY_CODE) == len(BUILTIN_DATUMS)
+        for datum in BUILTIN_DATUMS:
+            assert BUILTIN_DATUMS_BY_CODE[datum.code] is datum
+        assert BUILTIN_DATUMS_BY_CODE[6277] is OSGB36
+
+    def test_builtin_datums_by_code_is_read_only(self) -> None:
+        """Test that the built-in datums mapping cannot be modified."""
+        with pytest.raises(TypeError):
+            BUILTIN_DATUMS_BY_CODE[1234] = WGS84  # type: ignore[index]
+
 
 class TestDatumEllipsoidRelationships:
     """Tests for datum-ellipsoid relationships."""
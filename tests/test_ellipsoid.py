@@ -1,12 +1,16 @@
 """Tests for the ellipsoid module."""
 
 import math
-from dataclasses import FrozenInstanceError
+import pickle
+import sys
+from dataclasses import FrozenInstanceError, asdict
 
 import pytest
 
 from geodesy.ellipsoid import (
     AIRY_1830,
+    BUILTIN_ELLIPSOIDS,
+    BUILTIN_ELLIPSOIDS_BY_CODE,
     CLARKE_1866,
     GRS_1980,
     INTERNATIONAL_1924,
@@ -14,6 +18,27 @@ from geodesy.ellipsoid import (
     Ellipsoid,
 )
 
+BUILTIN_IDS = tuple(
+    ellipsoid.name.upper().replace(" ", "_") for ellipsoid in BUILTIN_ELLIPSOIDS
+)
+
+# Published reference values of the derived properties (WGS 84: NIMA TR8350.2,
+# GRS 1980: Moritz, "Geodetic Reference System 1980")
+EXPECTED = {
+    "WGS_84": {
+        "b": 6356752.3142,
+        "e2": 0.00669437999014,
+        "e": 0.0818191908426,
+        "ep2": 0.00673949674228,
+    },
+    "GRS_1980": {
+        "b": 6356752.3141,
+        "e2": 0.00669438002290,
+        "e": 0.0818191910428,
+        "ep2": 0.00673949677548,
+    },
+}
+
 
 class TestEllipsoid:
     """Tests for the Ellipsoid class."""
@@ -44,6 +69,24 @@ class TestEllipsoid:
         with pytest.raises(FrozenInstanceError):
             ellipsoid.name = "Changed"  # type: ignore[misc]
 
+    def test_ellipsoid_pickle_round_trip(self) -> None:
+        """Test that pickled ellipsoids are equal and hash equally."""
+        for ellipsoid in BUILTIN_ELLIPSOIDS:
+            loaded = pickle.loads(pickle.dumps(ellipsoid))  # noqa: S301
+            assert loaded == ellipsoid
+            assert hash(loaded) == hash(ellipsoid)
+            assert loaded.b == ellipsoid.b
+            assert loaded.urn == ellipsoid.urn
+
+    def test_ellipsoid_asdict_excludes_cached_hash(self) -> None:
+        """Test that the cached hash is not a dataclass field."""
+        assert "_hash" not in asdict(WGS_84)
+
+    def test_ellipsoid_has_no_instance_dict(self) -> None:
+        """Test that ellipsoids use slots instead of an instance dictionary."""
+        ellipsoid = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.257223563)
+        assert not hasattr(ellipsoid, "__dict__")
+
     def test_ellipsoid_equality(self) -> None:
         """Test ellipsoid equality comparison."""
         e1 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.257223563)
@@ -52,6 +95,33 @@ class TestEllipsoid:
         assert e1 == e2
         assert e1 != e3
 
+    def test_ellipsoid_equality_per_field(self) -> None:
+        """Test that every defining field takes part in equality comparison."""
+        ellipsoid = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        assert ellipsoid != Ellipsoid(name="Other", code=1234, a=6378137.0, f=1 / 298.0)
+        assert ellipsoid != Ellipsoid(name="Test", code=5678, a=6378137.0, f=1 / 298.0)
+        assert ellipsoid != Ellipsoid(name="Test", code=1234, a=6378000.0, f=1 / 298.0)
+        assert ellipsoid != Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 300.0)
+        assert ellipsoid != Ellipsoid(
+            name="Test", code=1234, a=6378137.0, f=1 / 298.0, remarks=""
+        )
+
+    def test_ellipsoid_identity_equality(self) -> None:
+        """Test that an ellipsoid equals itself."""
+        assert WGS_84 == WGS_84  # noqa: PLR0124
+
+    def test_ellipsoid_inequality_with_other_types(self) -> None:
+        """Test that ellipsoids do not equal other types."""
+        assert WGS_84 != "urn:ogc:def:ellipsoid:EPSG::7030"
+
+    def test_ellipsoid_equality_ignores_derived_properties(self) -> None:
+        """Test that derived properties do not take part in equality or hashing."""
+        e1 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        e2 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        object.__setattr__(e2, "b", 0.0)
+        assert e1 == e2
+        assert hash(e1) == hash(e2)
+
     def test_ellipsoid_hash(self) -> None:
         """Test that ellipsoids are hashable."""
         e1 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.257223563)
@@ -61,43 +131,78 @@ class TestEllipsoid:
         ellipsoids = {e1, e2}
         assert len(ellipsoids) == 1
 
+    def test_get_returns_cached_instance(self) -> None:
+        """Test that get() returns the same instance for identical arguments."""
+        e1 = Ellipsoid.get(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        e2 = Ellipsoid.get(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        assert e1 is e2
+        assert e1 == Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+
+    def test_get_with_different_arguments(self) -> None:
+        """Test that get() returns distinct instances for different arguments."""
+        e1 = Ellipsoid.get(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        e2 = Ellipsoid.get(name="Test", code=1234, a=6378137.0, f=1 / 300.0)
+        assert e1 is not e2
+        assert e2.f == 1 / 300.0
+
+    def test_get_distinguishes_int_and_float_arguments(self) -> None:
+        """Test that get() does not reuse an instance created with an int."""
+        e1 = Ellipsoid.get("Typed", 1234, 6378137, 0.0)
+        e2 = Ellipsoid.get("Typed", 1234, 6378137.0, 0.0)
+        assert e1 is not e2
+        assert type(e1.a) is int
+        assert type(e2.a) is float
+
+    def test_get_positional_and_keyword_arguments(self) -> None:
+        """Test that get() returns the same instance for positional and keyword calls."""
+        e1 = Ellipsoid.get("Mixed", 1234, 6378137.0, 1 / 298.0)
+        e2 = Ellipsoid.get(name="Mixed", code=1234, a=6378137.0, f=1 / 298.0)
+        assert e1 is e2
+
 
 class TestEllipsoidDerivedProperties:
     """Tests for ellipsoid derived properties."""
 
     def test_semi_minor_axis_b(self) -> None:
         """Test semi-minor axis calculation."""
-        # For WGS 84: b = a * (1 - f)
-        expected_b = WGS_84.a * (1 - WGS_84.f)
-        assert WGS_84.b == pytest.approx(expected_b)
-        assert WGS_84.b == pytest.approx(6356752.314245179, rel=1e-9)
+        assert WGS_84.b == pytest.approx(EXPECTED["WGS_84"]["b"], rel=1e-9)
 
     def test_first_eccentricity_squared_e2(self) -> None:
-        """Test first eccentricity squared calculation.
-
-        Formula: e2 = 2*f - f^2
-        """
-        expected_e2 = 2 * WGS_84.f - WGS_84.f**2
-        assert WGS_84.e2 == pytest.approx(expected_e2)
-        assert WGS_84.e2 == pytest.approx(0.00669437999014, rel=1e-9)
+        """Test first eccentricity squared calculation."""
+        assert WGS_84.e2 == pytest.approx(EXPECTED["WGS_84"]["e2"], rel=1e-9)
 
     def test_first_eccentricity_e(self) -> None:
-        """Test first eccentricity calculation.
-
-        Formula: e = sqrt(e2)
-        """
-        expected_e = math.sqrt(WGS_84.e2)
-        assert WGS_84.e == pytest.approx(expected_e)
-        assert WGS_84.e == pytest.approx(0.0818191908426, rel=1e-9)
+        """Test first eccentricity calculation."""
+        assert WGS_84.e == pytest.approx(EXPECTED["WGS_84"]["e"], rel=1e-9)
 
     def test_second_eccentricity_squared_ep2(self) -> None:
-        """Test second eccentricity squared calculation.
-
-        Formula: ep2 = e2 / (1 - e2)
-        """
-        expected_ep2 = WGS_84.e2 / (1 - WGS_84.e2)
-        assert WGS_84.ep2 == pytest.approx(expected_ep2)
-        assert WGS_84.ep2 == pytest.approx(0.00673949674228, rel=1e-9)
+        """Test second eccentricity squared calculation."""
+        assert WGS_84.ep2 == pytest.approx(EXPECTED["WGS_84"]["ep2"], rel=1e-9)
+
+    def test_grs_1980_derived_properties(self) -> None:
+        """Test GRS 1980 derived properties against published values."""
+        expected = EXPECTED["GRS_1980"]
+        assert GRS_1980.b == pytest.approx(expected["b"], rel=1e-9)
+        assert GRS_1980.e2 == pytest.approx(expected["e2"], rel=1e-9)
+        assert GRS_1980.e == pytest.approx(expected["e"], rel=1e-9)
+        assert GRS_1980.ep2 == pytest.approx(expected["ep2"], rel=1e-9)
+
+    def test_inverse_flattening_rf(self) -> None:
+        """Test inverse flattening calculation."""
+        assert WGS_84.rf == pytest.approx(298.257223563, rel=1e-12)
+        assert AIRY_1830.rf == pytest.approx(299.3249646, rel=1e-12)
+
+    def test_one_minus_f(self) -> None:
+        """Test the axis ratio 1 - f."""
+        assert WGS_84.one_minus_f == 1 - WGS_84.f
+        assert WGS_84.one_minus_f == pytest.approx(WGS_84.b / WGS_84.a)
+
+    def test_second_eccentricity_squared_axes(self) -> None:
+        """Test that ep2 = (a^2 - b^2) / b^2."""
+        a2 = WGS_84.a * WGS_84.a
+        b2 = WGS_84.b * WGS_84.b
+        expected_ep2 = (a2 - b2) / b2
+        assert WGS_84.ep2 == pytest.approx(expected_ep2, rel=1e-9)
 
     def test_urn(self) -> None:
         """Test URN generation."""
@@ -108,15 +213,35 @@ class TestEllipsoidDerivedProperties:
         ellipsoid = Ellipsoid(name="Custom", code=9999, a=6378137.0, f=1 / 300.0)
         assert ellipsoid.urn == "urn:ogc:def:ellipsoid:EPSG::9999"
 
+    def test_urn_is_interned(self) -> None:
+        """Test that ellipsoid URNs are interned."""
+        e1 = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
+        e2 = Ellipsoid(name="Other", code=1234, a=6378137.0, f=1 / 300.0)
+        assert e1.urn is e2.urn
+        assert e1.urn is sys.intern("urn:ogc:def:ellipsoid:EPSG::1234")
+
     def test_derived_properties_computed_at_init(self) -> None:
         """Test that derived properties are computed at initialization."""
         ellipsoid = Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0)
         # Derived properties should be available immediately after creation
         assert ellipsoid.b == ellipsoid.a * (1 - ellipsoid.f)
-        assert ellipsoid.e2 == 2 * ellipsoid.f - ellipsoid.f**2
-        assert ellipsoid.e == ellipsoid.e2**0.5
+        assert ellipsoid.e2 == 2 * ellipsoid.f - ellipsoid.f * ellipsoid.f
+        assert ellipsoid.e == math.sqrt(ellipsoid.e2)
         assert ellipsoid.urn == "urn:ogc:def:ellipsoid:EPSG::1234"
 
+    def test_derived_properties_not_accepted_at_init(self) -> None:
+        """Test that derived properties cannot be passed to the constructor."""
+        with pytest.raises(TypeError):
+            Ellipsoid(name="Test", code=1234, a=6378137.0, f=1 / 298.0, b=0.0)  # type: ignore[call-arg]
+
+    def test_unpack(self) -> None:
+        """Test unpacking the parameters used in geodetic formulas."""
+        a, b, e2, ep2 = WGS_84.unpack()
+        assert a == WGS_84.a
+        assert b == WGS_84.b
+        assert e2 == WGS_84.e2
+        assert ep2 == WGS_84.ep2
+
     def test_sphere_ellipsoid(self) -> None:
         """Test an ellipsoid with zero flattening (sphere)."""
         sphere = Ellipsoid(name="Sphere", code=0, a=6371000.0, f=0.0)
@@ -124,6 +249,7 @@ class TestEllipsoidDerivedProperties:
         assert sphere.e2 == 0.0
         assert sphere.e == 0.0
         assert sphere.ep2 == 0.0
+        assert sphere.rf == math.inf
 
 
 class TestBuiltinEllipsoids:
@@ -179,22 +305,41 @@ class TestBuiltinEllipsoids:
         # But they're very close
         assert WGS_84.f == pytest.approx(GRS_1980.f, rel=1e-6)
 
+    def test_builtin_ellipsoids(self) -> None:
+        """Test that all built-in ellipsoids are listed."""
+        assert BUILTIN_ELLIPSOIDS == (
+            WGS_84,
+            GRS_1980,
+            AIRY_1830,
+            CLARKE_1866,
+            INTERNATIONAL_1924,
+        )
+
+    def test_builtin_ellipsoids_by_code(self) -> None:
+        """Test looking up built-in ellipsoids by EPSG code."""
+        assert len(BUILTIN_ELLIPSOIDS_BY_CODE) == len(BUILTIN_ELLIPSOIDS)
+        for ellipsoid in BUILTIN_ELLIPSOIDS:
+            assert BUILTIN_ELLIPSOIDS_BY_CODE[ellipsoid.code] is ellipsoid
+        assert BUILTIN_ELLIPSOIDS_BY_CODE[7030] is WGS_84
+
+    def test_builtin_ellipsoids_by_code_is_read_only(self) -> None:
+        """Test that the built-in ellipsoids mapping cannot be modified."""
+        with pytest.raises(TypeError):
+            BUILTIN_ELLIPSOIDS_BY_CODE[1234] = WGS_84  # type: ignore[index]
+
     def test_all_ellipsoids_have_unique_codes(self) -> None:
         """Test that all built-in ellipsoids have unique EPSG codes."""
-        ellipsoids = [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924]
-        codes = [e.code for e in ellipsoids]
+        codes = [e.code for e in BUILTIN_ELLIPSOIDS]
         assert len(codes) == len(set(codes))
 
     def test_all_ellipsoids_have_positive_semi_major_axis(self) -> None:
         """Test that all built-in ellipsoids have positive semi-major axis."""
-        ellipsoids = [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924]
-        for ellipsoid in ellipsoids:
+        for ellipsoid in BUILTIN_ELLIPSOIDS:
             assert ellipsoid.a > 0
 
     def test_all_ellipsoids_have_positive_flattening(self) -> None:
         """Test that all built-in ellipsoids have positive flattening."""
-        ellipsoids = [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924]
-        for ellipsoid in ellipsoids:
+        for ellipsoid in BUILTIN_ELLIPSOIDS:
             assert ellipsoid.f > 0
             assert ellipsoid.f < 1  # Flattening must be less than 1
 
@@ -202,49 +347,30 @@ class TestBuiltinEllipsoids:
 class TestEllipsoidDerivedPropertiesConsistency:
     """Tests for consistency of derived properties across ellipsoids."""
 
-    @pytest.mark.parametrize(
-        "ellipsoid",
-        [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924],
-        ids=["WGS_84", "GRS_1980", "AIRY_1830", "CLARKE_1866", "INTERNATIONAL_1924"],
+    pytestmark = pytest.mark.parametrize(
+        "ellipsoid", BUILTIN_ELLIPSOIDS, ids=BUILTIN_IDS
     )
+
     def test_semi_minor_axis_less_than_semi_major(self, ellipsoid: Ellipsoid) -> None:
         """Test that b < a for all ellipsoids (oblate spheroid)."""
         assert ellipsoid.b < ellipsoid.a
 
-    @pytest.mark.parametrize(
-        "ellipsoid",
-        [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924],
-        ids=["WGS_84", "GRS_1980", "AIRY_1830", "CLARKE_1866", "INTERNATIONAL_1924"],
-    )
     def test_eccentricity_squared_positive(self, ellipsoid: Ellipsoid) -> None:
         """Test that e2 > 0 for all ellipsoids."""
         assert ellipsoid.e2 > 0
 
-    @pytest.mark.parametrize(
-        "ellipsoid",
-        [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924],
-        ids=["WGS_84", "GRS_1980", "AIRY_1830", "CLARKE_1866", "INTERNATIONAL_1924"],
-    )
     def test_eccentricity_less_than_one(self, ellipsoid: Ellipsoid) -> None:
         """Test that e < 1 for all ellipsoids."""
         assert ellipsoid.e < 1
 
-    @pytest.mark.parametrize(
-        "ellipsoid",
-        [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924],
-        ids=["WGS_84", "GRS_1980", "AIRY_1830", "CLARKE_1866", "INTERNATIONAL_1924"],
-    )
     def test_b_formula_consistency(self, ellipsoid: Ellipsoid) -> None:
         """Test that b = a * (1 - f) holds."""
         expected_b = ellipsoid.a * (1 - ellipsoid.f)
-        assert ellipsoid.b == pytest.approx(expected_b)
+        assert math.isclose(ellipsoid.b, expected_b, rel_tol=1e-12)
 
-    @pytest.mark.parametrize(
-        "ellipsoid",
-        [WGS_84, GRS_1980, AIRY_1830, CLARKE_1866, INTERNATIONAL_1924],
-        ids=["WGS_84", "GRS_1980", "AIRY_1830", "CLARKE_1866", "INTERNATIONAL_1924"],
-    )
     def test_eccentricity_relationship(self, ellipsoid: Ellipsoid) -> None:
         """Test the relationship e^2 = (a^2 - b^2) / a^2."""
-        expected_e2 = (ellipsoid.a**2 - ellipsoid.b**2) / ellipsoid.a**2
-        assert ellipsoid.e2 == pytest.approx(expected_e2, rel=1e-12)
+        a2 = ellipsoid.a * ellipsoid.a
+        b2 = ellipsoid.b * ellipsoid.b
+        expected_e2 = (a2 - b2) / a2
+        assert math.isclose(ellipsoid.e2, expected_e2, rel_tol=1e-12)